@@ -17,29 +17,161 @@ Usage Examples:
 """
 
 import argparse
+import json
+import os
+import socket
 import sys
-from typing import List, Optional
-from pymodbus.client import ModbusSerialClient, ModbusTcpClient
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+# pymodbus (and asyncio) are imported where a connection is made: importing
+# them dominates startup, and --help, argument errors and r4dcb08d-backed
+# calls never need them
+
+DEFAULT_SOCKET_PATH = "/run/r4dcb08/r4dcb08.sock"  # Unix socket of r4dcb08d.py
+WATCH_MAX_FAILURES = 5  # watch stops after this many failed reads in a row
+
+
+def __getattr__(name: str):
+    """Provide the pymodbus client classes as module attributes on first use."""
+    if name in ("AsyncModbusSerialClient", "ModbusSerialClient", "ModbusTcpClient"):
+        import pymodbus.client
+        return getattr(pymodbus.client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@dataclass
+class ChannelBlock:
+    """Readings of all 8 channels, stored as one sequence per field."""
+    raw: List[int]  # Raw register values
+    values: List[Optional[float]]  # Decoded values in °C, None if no sensor
+    present: List[bool]  # Whether a sensor is connected
+    
+    @classmethod
+    def from_registers(cls, registers: List[int]) -> "ChannelBlock":
+        """Build a block from raw register values."""
+        values = R4DCB08Client.decode_block(registers)
+        return cls(list(registers), values, [value is not None for value in values])
+
+
+def default_rtu_timeout(baudrate: int) -> float:
+    """Timeout for one 16-register transaction, derived from the baud rate."""
+    # Time to transmit one character: start bit + 8 data bits + 1 stop bit (N, 8, 1)
+    t_byte = (1 + 8 + 1) / baudrate
+    # Request (8 bytes) + 16-register response (37 bytes), with margin
+    # for the device turnaround
+    return max(0.05, 4 * (8 + 37) * t_byte)
+
+
+class _DaemonResponse:
+    """Stand-in for a pymodbus response received from r4dcb08d."""
+    
+    def __init__(self, reply: dict):
+        self.registers = reply.get("raw", [])
+        self.error = reply.get("error")
+    
+    def isError(self) -> bool:
+        return self.error is not None
+    
+    def __str__(self) -> str:
+        return str(self.error)
+
+
+class _DaemonConnection:
+    """Forward register reads and writes to a running r4dcb08d over its Unix socket."""
+    
+    def __init__(self, socket_path: str, serial_port: str, baudrate: int,
+                 connect_timeout: float = 1.0):
+        self.socket_path = socket_path
+        self.serial_port = serial_port
+        self.baudrate = baudrate
+        self.connect_timeout = connect_timeout  # hello is answered without waiting for the bus
+        self._socket = None
+        self._file = None
+    
+    def connect(self) -> bool:
+        """Connect to the daemon and check that it serves our serial port and baud rate."""
+        try:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.settimeout(self.connect_timeout)
+            self._socket.connect(self.socket_path)
+            self._file = self._socket.makefile("rwb")
+            reply = self._request(cmd="hello", port=os.path.realpath(self.serial_port),
+                                  baudrate=self.baudrate)
+            if reply.get("ok", False):
+                # The daemon reports the longest a request may hold its bus (its
+                # own timeout and retries); allow for one request queued ahead of ours
+                self._socket.settimeout(2 * float(reply["request_time"]) + 1.0)
+                return True
+        except (OSError, ValueError, KeyError):
+            pass
+        
+        self.close()
+        return False
+    
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+        if self._socket:
+            self._socket.close()
+            self._socket = None
+    
+    def _request(self, **request) -> dict:
+        """Send one newline-delimited JSON request and return the reply."""
+        self._file.write(json.dumps(request).encode() + b"\n")
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("r4dcb08d closed the connection")
+        return json.loads(line)
+    
+    def read_holding_registers(self, address: int, count: int = 1, device_id: int = 1,
+                               max_age: float = 0.0) -> _DaemonResponse:
+        response = _DaemonResponse(self._request(cmd="read-all", address=device_id, max_age=max_age))
+        # The daemon always returns the full 16-register block
+        response.registers = response.registers[address:address + count]
+        return response
+    
+    def write_register(self, address: int, value: int, device_id: int = 1) -> _DaemonResponse:
+        return _DaemonResponse(self._request(cmd="write-register", address=device_id,
+                                             register=address, value=value))
+
+
+class _BusTiming:
+    """Modbus RTU inter-frame timing of one serial port, shared by all clients using it."""
+    
+    def __init__(self, silent_interval: float = 0.0):
+        self.silent_interval = silent_interval  # 3.5 characters, 0 if not needed
+        self.last_transaction = 0.0
 
 
 class R4DCB08Client:
     """R4DCB08 Temperature Collector Client supporting both RTU and TCP"""
     
-    def __init__(self, address: int = 1, timeout: float = 1.0, 
+    def __init__(self, address: int = 1, timeout: Optional[float] = None, 
                  # RTU parameters
                  serial_port: str = None, baudrate: int = 9600,
                  # TCP parameters  
-                 host: str = None, tcp_port: int = 502):
+                 host: str = None, tcp_port: int = 502,
+                 cache_ttl: float = 0.5, socket_path: str = None):
         """
         Initialize the R4DCB08 client.
         
         Args:
             address: Modbus device address (1-247)
-            timeout: Communication timeout in seconds
+            timeout: Communication timeout in seconds (default: derived from
+                the baud rate for RTU, 1.0 for TCP)
             serial_port: Serial port for RTU (e.g., "/dev/ttyUSB0", "COM3")
             baudrate: RTU baud rate (1200, 2400, 4800, 9600, 19200)
             host: TCP host IP address (e.g., "192.168.1.100")
             tcp_port: TCP port number (default: 502)
+            cache_ttl: Seconds a register read is reused by subsequent reads
+                (default: 0.5, 0 disables caching)
+            socket_path: Unix socket of a running r4dcb08d; RTU requests go
+                through the daemon when it serves serial_port
         """
         self.address = address
         self.timeout = timeout
@@ -47,8 +179,15 @@ class R4DCB08Client:
         self.baudrate = baudrate
         self.host = host
         self.tcp_port = tcp_port
+        self.socket_path = socket_path
         self.client = None
         self.connection_type = None
+        self.cache_ttl = cache_ttl
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._registers = None  # Last 16-register block read (temperatures + corrections)
+        self._registers_time = 0.0
+        self._bus = _BusTiming()
         
         # Determine connection type
         if serial_port and host:
@@ -64,19 +203,38 @@ class R4DCB08Client:
         """Connect to the device using RTU or TCP."""
         try:
             if self.connection_type == "RTU":
+                # Time to transmit one character: start bit + 8 data bits + 1 stop bit (N, 8, 1)
+                t_byte = (1 + 8 + 1) / self.baudrate
+                timeout = self.timeout
+                if timeout is None:
+                    timeout = default_rtu_timeout(self.baudrate)
+                
+                # Reuse the serial port held open by r4dcb08d, if it is running
+                if (self.socket_path and hasattr(socket, "AF_UNIX")
+                        and os.path.exists(self.socket_path)):
+                    daemon = _DaemonConnection(self.socket_path, self.serial_port, self.baudrate)
+                    if daemon.connect():
+                        self.client = daemon
+                        return True
+                
+                from pymodbus.client import ModbusSerialClient
+                
                 self.client = ModbusSerialClient(
                     port=self.serial_port,
                     baudrate=self.baudrate,
                     parity='N',  # No parity for R4DCB08
                     stopbits=1,
                     bytesize=8,
-                    timeout=self.timeout
+                    timeout=timeout
                 )
+                self._bus = _BusTiming(silent_interval=3.5 * t_byte)
             else:  # TCP
+                from pymodbus.client import ModbusTcpClient
+                
                 self.client = ModbusTcpClient(
                     host=self.host,
                     port=self.tcp_port,
-                    timeout=self.timeout
+                    timeout=self.timeout if self.timeout is not None else 1.0
                 )
             
             return self.client.connect()
@@ -89,6 +247,18 @@ class R4DCB08Client:
         if self.client:
             self.client.close()
     
+    def share_connection(self, other: "R4DCB08Client"):
+        """Use the open connection of another client, e.g. for another device on the same bus."""
+        self.client = other.client
+        # The silent interval applies between any two frames on the bus
+        self._bus = other._bus
+    
+    @staticmethod
+    def to_signed(raw_value: int) -> int:
+        """Convert an unsigned 16-bit register value to a signed integer."""
+        # Sign extension without branching
+        return (raw_value ^ 0x8000) - 0x8000
+    
     @staticmethod
     def decode_temperature(raw_value: int) -> Optional[float]:
         """
@@ -100,52 +270,115 @@ class R4DCB08Client:
         if raw_value == 0x8000:  # 32768 indicates sensor error/disconnection
             return None
         
-        # Convert unsigned to signed 16-bit integer
-        if raw_value > 32767:
-            signed_value = raw_value - 65536
-        else:
-            signed_value = raw_value
-        
         # Temperature is encoded as (temperature * 10), divide by 10
-        return signed_value / 10.0
+        return R4DCB08Client.to_signed(raw_value) / 10.0
     
     @staticmethod
     def encode_temperature(temperature: float) -> int:
         """Encode temperature to raw register value."""
-        # Multiply by 10 and convert to integer
-        raw_value = int(temperature * 10)
+        # Multiply by 10 and convert to unsigned 16-bit (two's complement) integer
+        return int(temperature * 10) & 0xFFFF
+    
+    @staticmethod
+    def decode_block(registers: List[int]) -> List[Optional[float]]:
+        """Decode a block of raw register values (see decode_temperature)."""
+        to_signed = R4DCB08Client.to_signed
+        return [None if raw == 0x8000 else to_signed(raw) / 10.0 for raw in registers]
+    
+    def _transaction(self, request, *args, **kwargs):
+        """Run a Modbus request, keeping the RTU silent interval since the previous frame."""
+        bus = self._bus
+        if bus.silent_interval:
+            slack = bus.silent_interval - (time.monotonic() - bus.last_transaction)
+            if slack > 0:
+                time.sleep(slack)
         
-        # Convert signed to unsigned 16-bit integer
-        if raw_value < 0:
-            raw_value = raw_value + 65536
+        try:
+            return request(*args, **kwargs)
+        finally:
+            bus.last_transaction = time.monotonic()
+    
+    def _read_block(self, max_age: float = 0.0) -> List[int]:
+        """Read temperature (0x0000) and correction (0x0008) registers and keep them for reuse."""
+        kwargs = {}
+        if isinstance(self.client, _DaemonConnection):
+            # The daemon may answer from its own cache, within the same age limit
+            kwargs["max_age"] = max_age
+        result = self._transaction(
+            self.client.read_holding_registers, 0x0000, count=16, device_id=self.address, **kwargs
+        )
+        if result.isError():
+            raise Exception(f"Modbus error: {result}")
         
-        return raw_value
+        self._registers = result.registers
+        self._registers_time = time.monotonic()
+        return self._registers
     
-    def read_all_temperatures(self) -> List[Optional[float]]:
-        """Read temperatures from all 8 channels."""
+    def read_registers(self, max_age: Optional[float] = None) -> List[int]:
+        """
+        Read the raw temperature and correction registers (0x0000-0x000F).
+        
+        Args:
+            max_age: Reuse a previous read younger than this many seconds
+                (default: cache_ttl, 0 always reads the device)
+        """
+        if max_age is None:
+            max_age = self.cache_ttl
+        if (self._registers is not None
+                and time.monotonic() - self._registers_time < max_age):
+            self.cache_hits += 1
+            return self._registers
+        
+        self.cache_misses += 1
+        return self._read_block(max_age)
+    
+    def read_temperature_block(self, fresh: bool = False) -> ChannelBlock:
+        """
+        Read raw values, temperatures and sensor presence of all 8 channels.
+        
+        Args:
+            fresh: Always read the device instead of reusing a read younger than cache_ttl
+        """
         try:
-            result = self.client.read_holding_registers(0, count=8, device_id=self.address)
-            if result.isError():
-                raise Exception(f"Modbus error: {result}")
-            
-            return [self.decode_temperature(raw) for raw in result.registers]
+            # Temperatures (0x0000) and corrections (0x0008) are read in one request
+            registers = self.read_registers(0 if fresh else None)
+            return ChannelBlock.from_registers(registers[:8])
         except Exception as e:
             raise Exception(f"Failed to read temperatures: {e}")
     
+    def read_block(self) -> Tuple[ChannelBlock, ChannelBlock]:
+        """Read temperatures and corrections of all 8 channels in one request."""
+        try:
+            registers = self.read_registers()
+            return ChannelBlock.from_registers(registers[:8]), ChannelBlock.from_registers(registers[8:16])
+        except Exception as e:
+            raise Exception(f"Failed to read temperatures and corrections: {e}")
+    
+    def read_all_temperatures(self) -> List[Optional[float]]:
+        """Read temperatures from all 8 channels."""
+        return self.read_temperature_block().values
+    
     def read_single_temperature(self, channel: int) -> Optional[float]:
         """Read temperature from a single channel."""
         if not 0 <= channel <= 7:
             raise ValueError("Channel must be 0-7")
         
         try:
-            result = self.client.read_holding_registers(channel, count=1, device_id=self.address)
-            if result.isError():
-                raise Exception(f"Modbus error: {result}")
-            
-            return self.decode_temperature(result.registers[0])
+            return self.decode_temperature(self.read_registers()[channel])
         except Exception as e:
             raise Exception(f"Failed to read temperature from channel {channel}: {e}")
     
+    def write_register(self, register: int, value: int):
+        """Write a raw holding register value."""
+        result = self._transaction(
+            self.client.write_register, register, value, device_id=self.address
+        )
+        if result.isError():
+            raise Exception(f"Modbus error: {result}")
+        
+        # Cached registers no longer reflect the device
+        self._registers = None
+    
     def set_temperature_correction(self, channel: int, correction: float):
         """Set temperature correction for a specific channel."""
         if not 0 <= channel <= 7:
@@ -158,41 +391,204 @@ class R4DCB08Client:
             raw_correction = self.encode_temperature(correction)
             correction_register = 0x0008 + channel  # Correction registers start at 0x0008
             
-            result = self.client.write_register(
-                correction_register, raw_correction, device_id=self.address
-            )
-            if result.isError():
-                raise Exception(f"Modbus error: {result}")
+            self.write_register(correction_register, raw_correction)
         except Exception as e:
             raise Exception(f"Failed to set correction for channel {channel}: {e}")
     
-    def read_temperature_corrections(self) -> List[Optional[float]]:
-        """Read temperature corrections from all 8 channels."""
+    def read_correction_block(self) -> ChannelBlock:
+        """Read raw and decoded temperature corrections of all 8 channels."""
         try:
-            result = self.client.read_holding_registers(0x0008, count=8, device_id=self.address)
-            if result.isError():
-                raise Exception(f"Modbus error: {result}")
-            
-            return [self.decode_temperature(raw) for raw in result.registers]
+            registers = self.read_registers()
+            return ChannelBlock.from_registers(registers[8:16])
         except Exception as e:
             raise Exception(f"Failed to read temperature corrections: {e}")
+    
+    def read_temperature_corrections(self) -> List[Optional[float]]:
+        """Read temperature corrections from all 8 channels."""
+        return self.read_correction_block().values
 
 
-def cmd_read_all(client: R4DCB08Client):
-    """Read temperatures from all channels."""
+async def poll_all(serial_port: str, addresses: List[int], baudrate: int = 9600,
+                   timeout: Optional[float] = None
+                   ) -> Dict[int, Optional[Tuple[ChannelBlock, ChannelBlock]]]:
+    """
+    Read temperatures and corrections of several R4DCB08s sharing one RS485 bus.
+    
+    Requests go out one at a time (the bus is half-duplex), while each response
+    is decoded as the next request is already on the wire.
+    
+    Returns:
+        Temperature and correction blocks per address, None if a device did not respond
+    """
+    import asyncio
+    from pymodbus.client import AsyncModbusSerialClient
+    
+    client = AsyncModbusSerialClient(
+        port=serial_port,
+        baudrate=baudrate,
+        parity='N',  # No parity for R4DCB08
+        stopbits=1,
+        bytesize=8,
+        timeout=timeout if timeout is not None else default_rtu_timeout(baudrate)
+    )
+    if not await client.connect():
+        raise Exception(f"Failed to connect to {serial_port}")
+    
+    responses = asyncio.Queue()
+    results = {}
+    
+    async def send():
+        for address in addresses:
+            try:
+                result = await client.read_holding_registers(0x0000, count=16, device_id=address)
+                registers = None if result.isError() else result.registers
+            except Exception:
+                registers = None
+            await responses.put((address, registers))
+        await responses.put(None)
+    
+    async def decode():
+        while True:
+            item = await responses.get()
+            if item is None:
+                break
+            address, registers = item
+            if registers is None:
+                results[address] = None
+            else:
+                results[address] = (ChannelBlock.from_registers(registers[:8]),
+                                    ChannelBlock.from_registers(registers[8:16]))
+    
     try:
-        temperatures = client.read_all_temperatures()
-        print("R4DCB08 Temperature Readings:")
-        print("-" * 35)
+        await asyncio.gather(send(), decode())
+    finally:
+        client.close()
+    return results
+
+
+class AdaptivePoller:
+    """Adapt the polling interval to how often channel readings actually change."""
+    
+    def __init__(self, min_s: float = 0.25, max_s: float = 30.0,
+                 alpha: float = 0.5, smoothing: float = 0.3):
+        """
+        Initialize the poller.
         
-        for i, temp in enumerate(temperatures):
-            if temp is not None:
-                print(f"Channel {i}: {temp:.1f}°C")
-            else:
-                print(f"Channel {i}: No sensor")
+        Args:
+            min_s: Shortest polling interval in seconds
+            max_s: Longest polling interval in seconds
+            alpha: Fraction of the expected time-to-change to sleep
+            smoothing: Weight of the newest observation in the per-channel
+                moving average of time-to-change
+        """
+        self.min_s = min_s
+        self.max_s = max_s
+        self.alpha = alpha
+        self.smoothing = smoothing
+        self._changed_at = None  # Per-channel time of the last observed change
+        self._time_to_change = None  # Per-channel moving average of time between changes
+    
+    def next_interval(self, last_values: Optional[List[Optional[float]]],
+                      new_values: List[Optional[float]]) -> float:
+        """Record a new reading and return how long to sleep before the next one."""
+        now = time.monotonic()
+        if self._changed_at is None:
+            self._changed_at = [now] * len(new_values)
+            self._time_to_change = [0.0] * len(new_values)
+        
+        if last_values is not None:
+            for i, (old, new) in enumerate(zip(last_values, new_values)):
+                if old != new:
+                    elapsed = now - self._changed_at[i]
+                    self._changed_at[i] = now
+                    self._time_to_change[i] += self.smoothing * (elapsed - self._time_to_change[i])
+        
+        # A channel that has been stable for longer than its average is
+        # expected to stay stable, so the poller backs off over time
+        expected = min(max(ttc, now - changed_at)
+                       for ttc, changed_at in zip(self._time_to_change, self._changed_at))
+        return min(self.max_s, max(self.min_s, self.alpha * expected))
+
+
+class RingLog:
+    """Fixed-size ring buffer of the most recent readings of all 8 channels."""
+    
+    def __init__(self, size: int = 4096, channels: int = 8):
+        """
+        Initialize the log.
+        
+        Args:
+            size: Number of readings kept; older readings are overwritten
+            channels: Number of channels per reading
+        """
+        self.size = size
+        self.channels = channels
+        self.count = 0  # Total number of readings pushed
+        # Preallocated once, so logging allocates nothing per reading. Readings
+        # are stored as signed register values (0.1 °C steps, 2 bytes each) and
+        # only decoded when read back
+        self.raw = array('h', [-0x8000]) * (size * channels)  # -0x8000 (0x8000) if no sensor
+        self.timestamps = array('d', [0.0]) * size
+    
+    def __len__(self) -> int:
+        return min(self.count, self.size)
+    
+    def push(self, registers: List[int], timestamp: Optional[float] = None):
+        """Store one reading of raw register values, overwriting the oldest one when full."""
+        slot = self.count % self.size
+        base = slot * self.channels
+        for i, raw in enumerate(registers):
+            self.raw[base + i] = R4DCB08Client.to_signed(raw)
+        self.timestamps[slot] = time.time() if timestamp is None else timestamp
+        self.count += 1
+    
+    def channel(self, channel: int) -> List[Optional[float]]:
+        """Return the stored temperatures of a channel in °C, oldest first."""
+        start = self.count - len(self)
+        values = []
+        for n in range(start, self.count):
+            value = self.raw[(n % self.size) * self.channels + channel]
+            values.append(None if value == -0x8000 else value / 10.0)
+        return values
+
+
+def _write_lines(lines: List[str]):
+    """Write output lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _correction_lines(block: ChannelBlock) -> List[str]:
+    """Format a correction block as output lines."""
+    lines = ["Temperature Correction Values:", "-" * 35]
+    for i, correction in enumerate(block.values):
+        if block.present[i]:
+            lines.append(f"Channel {i}: {correction:+.1f}°C")
+        else:
+            lines.append(f"Channel {i}: No correction")
+    return lines
+
+
+def cmd_read_all(client: R4DCB08Client, corrections: bool = False):
+    """Read temperatures (and optionally corrections) from all channels."""
+    try:
+        # Temperatures and corrections come from the same request
+        block, correction_block = client.read_block()
     except Exception as e:
         print(f"Error: {e}")
         return 1
+    
+    lines = ["R4DCB08 Temperature Readings:", "-" * 35]
+    for i, temp in enumerate(block.values):
+        if block.present[i]:
+            lines.append(f"Channel {i}: {temp:.1f}°C")
+        else:
+            lines.append(f"Channel {i}: No sensor")
+    
+    if corrections:
+        lines.append("")
+        lines.extend(_correction_lines(correction_block))
+    _write_lines(lines)
     return 0
 
 
@@ -226,23 +622,143 @@ def cmd_set_correction(client: R4DCB08Client, channel: int, correction: float):
 def cmd_read_corrections(client: R4DCB08Client):
     """Read temperature corrections from all channels."""
     try:
-        corrections = client.read_temperature_corrections()
-        print("Temperature Correction Values:")
-        print("-" * 35)
-        
-        for i, correction in enumerate(corrections):
-            if correction is not None:
-                print(f"Channel {i}: {correction:+.1f}°C")
-            else:
-                print(f"Channel {i}: No correction")
+        block = client.read_correction_block()
     except Exception as e:
         print(f"Error: {e}")
         return 1
+    
+    _write_lines(_correction_lines(block))
     return 0
 
 
-def main():
-    """Main CLI function."""
+def cmd_watch(client: R4DCB08Client, min_interval: float, max_interval: float,
+              count: Optional[int] = None, history: int = 4096, json_output: bool = False):
+    """Continuously read all channels, polling faster while temperatures change."""
+    poller = AdaptivePoller(min_s=min_interval, max_s=max_interval)
+    log = RingLog(history)
+    temperatures = None
+    failures = 0  # Consecutive failed reads
+    try:
+        while count is None or log.count < count:
+            try:
+                # Cached repeats would look like unchanged readings to the poller
+                block = client.read_temperature_block(fresh=True)
+                failures = 0
+            except Exception as e:
+                print(f"Error: {e}")
+                failures += 1
+                if failures >= WATCH_MAX_FAILURES:
+                    print(f"Stopping after {failures} failed reads in a row")
+                    break
+                time.sleep(min_interval)
+                continue
+            
+            new_temperatures = block.values
+            if json_output:
+                # Integer tenths of °C, as stored by the device
+                decicelsius = [R4DCB08Client.to_signed(raw) if present else None
+                               for raw, present in zip(block.raw, block.present)]
+                print(json.dumps({"time": time.time(), "temp_decicelsius": decicelsius}), flush=True)
+            else:
+                values = " ".join(f"{temp:6.1f}" if temp is not None else "    --"
+                                  for temp in new_temperatures)
+                print(f"{time.strftime('%H:%M:%S')} {values}")
+            
+            log.push(block.raw)
+            interval = poller.next_interval(temperatures, new_temperatures)
+            temperatures = new_temperatures
+            if count is None or log.count < count:
+                time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+    
+    if len(log) and not json_output:
+        lines = ["", f"Summary of the last {len(log)} readings:", "-" * 35]
+        for channel in range(log.channels):
+            values = [value for value in log.channel(channel) if value is not None]
+            if values:
+                lines.append(f"Channel {channel}: min {min(values):.1f}°C, "
+                             f"avg {sum(values) / len(values):.1f}°C, max {max(values):.1f}°C")
+            else:
+                lines.append(f"Channel {channel}: No sensor")
+        _write_lines(lines)
+    return 1 if failures else 0
+
+
+def _poll_daemon(socket_path: str, serial_port: str, addresses: List[int], baudrate: int,
+                 max_age: float = 0.0
+                 ) -> Optional[Dict[int, Optional[Tuple[ChannelBlock, ChannelBlock]]]]:
+    """Read several devices through r4dcb08d (see poll_all), or None if the daemon is not usable."""
+    if not (hasattr(socket, "AF_UNIX") and os.path.exists(socket_path)):
+        return None
+    
+    daemon = _DaemonConnection(socket_path, serial_port, baudrate)
+    if not daemon.connect():
+        return None
+    
+    results = {}
+    try:
+        for address in addresses:
+            try:
+                response = daemon.read_holding_registers(0x0000, count=16, device_id=address,
+                                                         max_age=max_age)
+            except (OSError, ValueError):
+                results[address] = None
+                # A timed-out stream cannot be read again: reconnect for the remaining devices
+                daemon.close()
+                if not daemon.connect():
+                    break
+                continue
+            
+            if response.isError():
+                results[address] = None
+            else:
+                results[address] = (ChannelBlock.from_registers(response.registers[:8]),
+                                    ChannelBlock.from_registers(response.registers[8:16]))
+    finally:
+        daemon.close()
+    
+    for address in addresses:
+        results.setdefault(address, None)  # Not read, the daemon went away
+    return results
+
+
+def cmd_read_bus(serial_port: str, addresses: List[int], baudrate: int,
+                 timeout: Optional[float] = None, socket_path: Optional[str] = None,
+                 cache_ttl: float = 0.5):
+    """Read temperatures from several devices on the same bus."""
+    import asyncio
+    
+    results = None
+    if socket_path:
+        # The daemon holds the serial port open (exclusively) while it runs
+        results = _poll_daemon(socket_path, serial_port, addresses, baudrate, cache_ttl)
+    
+    if results is None:
+        try:
+            results = asyncio.run(poll_all(serial_port, addresses, baudrate, timeout))
+        except Exception as e:
+            print(f"Error: {e}")
+            if socket_path and os.path.exists(socket_path):
+                print(f"Note: r4dcb08d at {socket_path} may hold the port; "
+                      "check that it serves this port and baud rate")
+            return 1
+    
+    lines = ["R4DCB08 Temperature Readings:", "-" * 35]
+    for address in addresses:
+        if results[address] is None:
+            lines.append(f"Device {address}: No response")
+            continue
+        
+        values = " ".join(f"{temp:6.1f}" if temp is not None else "    --"
+                          for temp in results[address][0].values)
+        lines.append(f"Device {address}: {values}")
+    _write_lines(lines)
+    return 0 if all(result is not None for result in results.values()) else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
     parser = argparse.ArgumentParser(
         description="R4DCB08 Temperature Collector Command Line Interface",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -250,8 +766,11 @@ def main():
 Examples:
   # RTU (Serial) connection
   %(prog)s rtu --port /dev/ttyUSB0 --address 1 read-all
+  %(prog)s rtu --port /dev/ttyUSB0 read-all --corrections
   %(prog)s rtu --port COM3 --address 2 read-channel 0
   %(prog)s rtu --port /dev/ttyUSB0 set-correction 3 1.5
+  %(prog)s rtu --port /dev/ttyUSB0 watch --max-interval 10
+  %(prog)s rtu --port /dev/ttyUSB0 read-bus 1 2 3
   
   # TCP connection  
   %(prog)s tcp --host 192.168.1.100 --port 502 read-all
@@ -268,13 +787,17 @@ Examples:
     rtu_parser = connection_parsers.add_parser('rtu', help='Modbus RTU (Serial) connection')
     rtu_parser.add_argument('--port', '-p', required=True,
                            help='Serial port (e.g., /dev/ttyUSB0, COM3)')
-    rtu_parser.add_argument('--address', '-a', type=int, default=1,
+    rtu_parser.add_argument('--address', '-a', type=int, default=None,
                            help='Modbus device address (1-247, default: 1)')
     rtu_parser.add_argument('--baudrate', '-b', type=int, default=9600,
                            choices=[1200, 2400, 4800, 9600, 19200],
                            help='Baud rate (default: 9600)')
-    rtu_parser.add_argument('--timeout', '-t', type=float, default=1.0,
-                           help='Communication timeout in seconds (default: 1.0)')
+    rtu_parser.add_argument('--timeout', '-t', type=float, default=None,
+                           help='Communication timeout in seconds (default: derived from baud rate)')
+    rtu_parser.add_argument('--socket', '-s', default=DEFAULT_SOCKET_PATH,
+                           help=f'Unix socket of r4dcb08d, used when present (default: {DEFAULT_SOCKET_PATH})')
+    rtu_parser.add_argument('--no-daemon', action='store_true',
+                           help='Always open the serial port directly')
     
     # TCP connection parser  
     tcp_parser = connection_parsers.add_parser('tcp', help='Modbus TCP connection')
@@ -282,18 +805,25 @@ Examples:
                            help='TCP host IP address (e.g., 192.168.1.100)')
     tcp_parser.add_argument('--port', '-p', type=int, default=502,
                            help='TCP port (default: 502)')
-    tcp_parser.add_argument('--address', '-a', type=int, default=1,
+    tcp_parser.add_argument('--address', '-a', type=int, default=None,
                            help='Modbus device address (1-247, default: 1)')
     tcp_parser.add_argument('--timeout', '-t', type=float, default=1.0,
                            help='Communication timeout in seconds (default: 1.0)')
     
     # Add command subparsers to both RTU and TCP
     for conn_parser in [rtu_parser, tcp_parser]:
+        conn_parser.add_argument('--cache-ttl', type=float, default=0.5,
+                                 help='Seconds a register read is reused (default: 0.5, 0 disables)')
+        conn_parser.add_argument('--stats', action='store_true',
+                                 help='Print register cache statistics after the command')
+        
         cmd_subparsers = conn_parser.add_subparsers(dest='command', help='Available commands')
         cmd_subparsers.required = True
         
         # Read all temperatures
-        cmd_subparsers.add_parser('read-all', help='Read temperatures from all 8 channels')
+        all_parser = cmd_subparsers.add_parser('read-all', help='Read temperatures from all 8 channels')
+        all_parser.add_argument('--corrections', '-c', action='store_true',
+                                help='Also show correction values (read in the same request)')
         
         # Read single channel
         read_parser = cmd_subparsers.add_parser('read-channel', help='Read temperature from specific channel')
@@ -309,14 +839,69 @@ Examples:
         
         # Read temperature corrections
         cmd_subparsers.add_parser('read-corrections', help='Read temperature corrections from all channels')
+        
+        # Watch temperatures with adaptive polling
+        watch_parser = cmd_subparsers.add_parser('watch', help='Continuously read all channels with adaptive polling')
+        watch_parser.add_argument('--min-interval', type=float, default=0.25,
+                                  help='Shortest polling interval in seconds (default: 0.25)')
+        watch_parser.add_argument('--max-interval', type=float, default=30.0,
+                                  help='Longest polling interval in seconds (default: 30)')
+        watch_parser.add_argument('--count', '-n', type=int, default=None,
+                                  help='Stop after this many readings (default: run until interrupted)')
+        watch_parser.add_argument('--history', type=int, default=4096,
+                                  help='Readings kept for the summary on exit (default: 4096)')
+        watch_parser.add_argument('--json', action='store_true',
+                                  help='Print one JSON object per reading with temperatures in tenths of °C')
+        
+        if conn_parser is rtu_parser:
+            # Read several devices on the same bus
+            bus_parser = cmd_subparsers.add_parser(
+                'read-bus', help='Read temperatures from several devices on the bus',
+                description='Read each listed device once. Goes through r4dcb08d when it is running '
+                            '(--cache-ttl then limits the age of its cached reads); '
+                            '--address and --stats do not apply.')
+            bus_parser.add_argument('addresses', type=int, nargs='+',
+                                    help='Modbus device addresses (1-247)')
     
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main CLI function."""
+    args = build_parser().parse_args(argv)
+    
+    if args.command == 'read-bus':
+        if args.address is not None:
+            print("Error: read-bus takes device addresses as arguments, not --address")
+            return 1
+        if args.stats:
+            print("Error: --stats is not supported by read-bus")
+            return 1
+    
+    if args.address is None:
+        args.address = 1
     
     # Validate device address
     if not 1 <= args.address <= 247:
         print("Error: Device address must be between 1 and 247")
         return 1
     
+    if args.command == 'watch' and args.history < 1:
+        print("Error: History must be at least 1 reading")
+        return 1
+    
+    if args.command == 'watch' and not 0 <= args.min_interval <= args.max_interval:
+        print("Error: Intervals must satisfy 0 <= --min-interval <= --max-interval")
+        return 1
+    
+    if args.command == 'read-bus':
+        if not all(1 <= address <= 247 for address in args.addresses):
+            print("Error: Device address must be between 1 and 247")
+            return 1
+        # Uses the daemon or its own (asynchronous) connection to the serial port
+        return cmd_read_bus(args.port, args.addresses, args.baudrate, args.timeout,
+                            None if args.no_daemon else args.socket, args.cache_ttl)
+    
     # Create client based on connection type
     try:
         if args.connection_type == 'rtu':
@@ -324,7 +909,9 @@ Examples:
                 address=args.address,
                 timeout=args.timeout,
                 serial_port=args.port,
-                baudrate=args.baudrate
+                baudrate=args.baudrate,
+                cache_ttl=args.cache_ttl,
+                socket_path=None if args.no_daemon else args.socket
             )
             connection_info = f"RTU at {args.port} (baud: {args.baudrate}, address: {args.address})"
         else:  # tcp
@@ -332,7 +919,8 @@ Examples:
                 address=args.address, 
                 timeout=args.timeout,
                 host=args.host,
-                tcp_port=args.port
+                tcp_port=args.port,
+                cache_ttl=args.cache_ttl
             )
             connection_info = f"TCP at {args.host}:{args.port} (address: {args.address})"
         
@@ -358,18 +946,23 @@ Examples:
     try:
         # Execute command
         if args.command == 'read-all':
-            return cmd_read_all(client)
+            return cmd_read_all(client, args.corrections)
         elif args.command == 'read-channel':
             return cmd_read_channel(client, args.channel)
         elif args.command == 'set-correction':
             return cmd_set_correction(client, args.channel, args.correction)
         elif args.command == 'read-corrections':
             return cmd_read_corrections(client)
+        elif args.command == 'watch':
+            return cmd_watch(client, args.min_interval, args.max_interval,
+                             args.count, args.history, args.json)
         else:
             print(f"Unknown command: {args.command}")
             return 1
     
     finally:
+        if args.stats:
+            print(f"Cache: {client.cache_hits} hits, {client.cache_misses} misses")
         client.disconnect()
 
 
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+R4DCB08 Daemon
+==============
+
+Keeps the serial port of an R4DCB08 bus open and serves register reads and
+writes over a Unix domain socket. While it is running, r4dcb08_cli.py sends
+its RTU requests through the daemon instead of opening the serial port and
+creating a Modbus client on every invocation.
+
+Protocol: one JSON object per line in each direction.
+    {"cmd": "hello", "port": "/dev/ttyUSB0", "baudrate": 9600} -> {"ok": true, "request_time": 0.75}
+    {"cmd": "read-all", "address": 1, "max_age": 0.5}          -> {"raw": [16 registers]}
+    {"cmd": "write-register", "address": 1, "register": 8, "value": 15} -> {"ok": true}
+"request_time" is the longest one request may hold the bus (timeout and
+retries), for sizing client timeouts. "max_age" limits how old a cached read
+may be (capped at --cache-ttl, 0 reads the device). Failures are answered
+with {"error": "..."}.
+
+Usage Examples:
+    python r4dcb08d.py --port /dev/ttyUSB0
+    python r4dcb08d.py --port /dev/ttyUSB0 --baudrate 19200 --socket /tmp/r4dcb08.sock
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+from typing import Dict, Optional
+
+from r4dcb08_cli import DEFAULT_SOCKET_PATH, R4DCB08Client, default_rtu_timeout
+
+
+class R4DCB08Daemon:
+    """Serve R4DCB08 register access for all devices on one serial port."""
+
+    def __init__(self, serial_port: str, baudrate: int = 9600,
+                 timeout: Optional[float] = None, cache_ttl: float = 0.5):
+        """
+        Initialize the daemon.
+
+        Args:
+            serial_port: Serial port of the RS485 bus (e.g., "/dev/ttyUSB0")
+            baudrate: RTU baud rate (1200, 2400, 4800, 9600, 19200)
+            timeout: Communication timeout in seconds (default: derived from baud rate)
+            cache_ttl: Seconds a register read is reused by subsequent requests
+        """
+        self.serial_port = serial_port
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        # The first attempt and pymodbus' 3 retries of one request
+        self.request_time = 4 * (timeout if timeout is not None else default_rtu_timeout(baudrate))
+        self._clients: Dict[int, R4DCB08Client] = {}  # One client per device address
+        self._lock = asyncio.Lock()  # The serial bus is half-duplex: one transaction at a time
+
+    def _client(self, address: int) -> R4DCB08Client:
+        """Return the client for a device address, sharing one open serial port."""
+        client = self._clients.get(address)
+        if client is None:
+            client = R4DCB08Client(
+                address=address,
+                timeout=self.timeout,
+                serial_port=self.serial_port,
+                baudrate=self.baudrate,
+                cache_ttl=self.cache_ttl
+            )
+            if self._clients:
+                client.share_connection(next(iter(self._clients.values())))
+            elif not client.connect():
+                raise Exception(f"Failed to connect to {self.serial_port}")
+            self._clients[address] = client
+        return client
+
+    def handle(self, request: dict) -> dict:
+        """Execute one request and return the reply."""
+        cmd = request.get("cmd")
+        if cmd == "hello":
+            if os.path.realpath(request.get("port", "")) != os.path.realpath(self.serial_port):
+                return {"error": f"Daemon serves {self.serial_port}"}
+            if request.get("baudrate", self.baudrate) != self.baudrate:
+                return {"error": f"Daemon runs at {self.baudrate} baud"}
+            return {"ok": True, "request_time": self.request_time}
+
+        address = int(request.get("address", 1))
+        if not 1 <= address <= 247:
+            return {"error": "Device address must be between 1 and 247"}
+        client = self._client(address)
+
+        if cmd == "read-all":
+            max_age = min(float(request.get("max_age", self.cache_ttl)), self.cache_ttl)
+            return {"raw": list(client.read_registers(max_age))}
+        elif cmd == "write-register":
+            client.write_register(int(request["register"]), int(request["value"]))
+            return {"ok": True}
+        else:
+            return {"error": f"Unknown command: {cmd}"}
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Answer requests from one CLI connection until it closes."""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if request.get("cmd") == "hello":
+                        reply = self.handle(request)  # Does not use the bus
+                    else:
+                        async with self._lock:
+                            reply = await loop.run_in_executor(None, self.handle, request)
+                except Exception as e:
+                    reply = {"error": str(e)}
+
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass  # The client went away, e.g. after timing out
+        except asyncio.CancelledError:
+            pass  # The daemon is stopping
+        finally:
+            writer.close()
+
+    async def serve(self, socket_path: str):
+        """Listen on a Unix socket until cancelled."""
+        # Stop cleanly (removing the socket) when systemd stops the service
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)  # Stale socket from a previous run
+
+        server = await asyncio.start_unix_server(self._serve_connection, path=socket_path)
+        os.chmod(socket_path, 0o660)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            # Wait for a request still using the serial port, and keep the lock
+            # so that no further request starts on the closed port
+            await self._lock.acquire()
+            for client in self._clients.values():
+                client.disconnect()
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+
+
+def main():
+    """Main daemon function."""
+    parser = argparse.ArgumentParser(
+        description="R4DCB08 daemon serving r4dcb08_cli.py over a Unix socket"
+    )
+    parser.add_argument('--port', '-p', required=True,
+                        help='Serial port (e.g., /dev/ttyUSB0)')
+    parser.add_argument('--baudrate', '-b', type=int, default=9600,
+                        choices=[1200, 2400, 4800, 9600, 19200],
+                        help='Baud rate (default: 9600)')
+    parser.add_argument('--timeout', '-t', type=float, default=None,
+                        help='Communication timeout in seconds (default: derived from baud rate)')
+    parser.add_argument('--cache-ttl', type=float, default=0.5,
+                        help='Seconds a register read is reused (default: 0.5, 0 disables)')
+    parser.add_argument('--socket', '-s', default=DEFAULT_SOCKET_PATH,
+                        help=f'Unix socket path (default: {DEFAULT_SOCKET_PATH})')
+    args = parser.parse_args()
+
+    async def run():
+        # Created inside the event loop, which its lock belongs to on older Pythons
+        daemon = R4DCB08Daemon(args.port, args.baudrate, args.timeout, args.cache_ttl)
+        await daemon.serve(args.socket)
+
+    try:
+        asyncio.run(run())
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())